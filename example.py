@@ -6,7 +6,7 @@ Example script demonstrating how to use the Google Maps Review Scraper
 """
 
 import argparse
-from maps_review_scraper import scrape_reviews, plot_reviews_by_month
+from maps_review_scraper import scrape_reviews, plot_reviews_by_month, save_reviews, load_reviews
 
 def main():
     # Parse command line arguments
@@ -14,12 +14,12 @@ def main():
     parser.add_argument('--mode', choices=['scrape', 'load'], default='scrape',
                         help='Mode to run: scrape for new reviews or load from existing CSV')
     parser.add_argument('--input-file', default='reviews.csv',
-                        help='CSV file to load reviews from (when mode=load)')
+                        help='Reviews file to load (.parquet, .feather, or .csv) when mode=load')
     args = parser.parse_args()
     
     # Example parameters
     url = "https://maps.app.goo.gl/aJCRiy3C5gtoBZpJ7"
-    output_file = "reviews.csv"
+    output_file = "reviews.parquet"  # binary columnar format; use .csv for compatibility
     max_reviews = 500
     wait_time = 12
     plot_output = "monthly_reviews.png"
@@ -41,8 +41,8 @@ def main():
             print(reviews_df.head())
             print("==========================\n")
             
-            # Save to CSV
-            reviews_df.to_csv(output_file, index=False)
+            # Save to disk (format determined by file extension)
+            save_reviews(reviews_df, output_file)
             print(f"Reviews saved to {output_file}")
             
             # Generate and save the plot
@@ -56,17 +56,12 @@ def main():
             print("No reviews were scraped.")
     
     else:  # Load mode
-        import pandas as pd
         print(f"Loading reviews from: {args.input_file}")
-        
+
         try:
-            # Load the reviews from CSV
-            reviews_df = pd.read_csv(args.input_file)
-            
-            # Convert the exact_time column to datetime for plotting
-            if 'exact_time' in reviews_df.columns:
-                reviews_df['exact_time'] = pd.to_datetime(reviews_df['exact_time'])
-            
+            # Load the reviews (format determined by file extension)
+            reviews_df = load_reviews(args.input_file)
+
             # Show basic info about the loaded data
             print(f"Successfully loaded {len(reviews_df)} reviews")
             print("\n===== First 5 Reviews =====")
@@ -8,6 +8,7 @@ A simplified script to scrape Google Maps reviews sorted by newest first
 
 import time
 import datetime
+import numpy as np
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -18,381 +19,631 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 import argparse
+import calendar
 import re
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 
-def parse_time_text(time_text):
+# Precompiled patterns for parse_time_text - compiling once at import time avoids
+# repeated regex cache lookups and string scans on every review
+_UNIT_RE = re.compile(r'(\d+|an?)\s+(minute|hour|day|week|month|year)s?\s+ago')
+
+# Seconds per unit, approximating months as 30 days and years as 365 days -
+# a plain int table keeps the unit dispatch to one dict lookup and one
+# timedelta construction with no branching
+_UNIT_SECS = {
+    'minute': 60,
+    'hour': 3600,
+    'day': 86400,
+    'week': 604800,
+    'month': 2592000,
+    'year': 31536000,
+}
+
+# Month name -> number, so "Month Year" dates skip strptime's locale
+# machinery and format re-parsing
+_MONTHS = {name: i for i, name in enumerate(calendar.month_name) if name}
+
+# Resolved chromedriver path, cached so repeated scrapes skip the
+# ChromeDriverManager network/disk check
+_DRIVER_PATH = None
+
+def parse_time_text(time_text, now=None):
     """
     Parse the time text from Google Maps reviews into a datetime object.
-    
+
     Args:
         time_text: Text representation of the review time (e.g., "2 days ago")
-        
+        now: Anchor timestamp for relative times (default: current time).
+            Pass the same value when parsing a batch so every review shares
+            one anchor instead of re-reading the clock per call.
+
     Returns:
         parsed_time: Datetime object representing the estimated review time
     """
-    now = datetime.datetime.now()
-    
-    # Handle different time formats
-    if "a day ago" in time_text.lower() or "1 day ago" in time_text.lower():
-        return now - datetime.timedelta(days=1)
-    elif "days ago" in time_text.lower():
-        days = int(re.search(r'(\d+)', time_text).group(1))
-        return now - datetime.timedelta(days=days)
-    elif "a week ago" in time_text.lower() or "1 week ago" in time_text.lower():
-        return now - datetime.timedelta(weeks=1)
-    elif "weeks ago" in time_text.lower():
-        weeks = int(re.search(r'(\d+)', time_text).group(1))
-        return now - datetime.timedelta(weeks=weeks)
-    elif "a month ago" in time_text.lower() or "1 month ago" in time_text.lower():
-        # Approximate a month as 30 days
-        return now - datetime.timedelta(days=30)
-    elif "months ago" in time_text.lower():
-        months = int(re.search(r'(\d+)', time_text).group(1))
-        # Approximate months as 30 days each
-        return now - datetime.timedelta(days=30*months)
-    elif "a year ago" in time_text.lower() or "1 year ago" in time_text.lower():
-        # Approximate a year as 365 days
-        return now - datetime.timedelta(days=365)
-    elif "years ago" in time_text.lower():
-        years = int(re.search(r'(\d+)', time_text).group(1))
-        # Approximate years as 365 days each
-        return now - datetime.timedelta(days=365*years)
-    elif "an hour ago" in time_text.lower() or "1 hour ago" in time_text.lower():
-        return now - datetime.timedelta(hours=1)
-    elif "hours ago" in time_text.lower():
-        hours = int(re.search(r'(\d+)', time_text).group(1))
-        return now - datetime.timedelta(hours=hours)
-    elif "minutes ago" in time_text.lower():
-        minutes = int(re.search(r'(\d+)', time_text).group(1))
-        return now - datetime.timedelta(minutes=minutes)
-    
-    # Try to parse specific date formats
-    try:
-        # Format: Month Year (e.g., "March 2022")
-        dt = datetime.datetime.strptime(time_text, "%B %Y")
-        return dt.replace(day=15)  # Middle of the month as an approximation
-    except ValueError:
-        pass
-    
+    if now is None:
+        now = datetime.datetime.now()
+
+    # Handle relative time formats ("2 days ago", "a week ago", ...)
+    match = _UNIT_RE.search(time_text.lower())
+    if match:
+        count_text, unit = match.groups()
+        count = 1 if count_text in ('a', 'an') else int(count_text)
+        return now - datetime.timedelta(seconds=count * _UNIT_SECS[unit])
+
+    # Format: Month Year (e.g., "March 2022")
+    parts = time_text.split()
+    if len(parts) == 2 and parts[0] in _MONTHS:
+        try:
+            # Middle of the month as an approximation
+            return datetime.datetime(int(parts[1]), _MONTHS[parts[0]], 15)
+        except ValueError:
+            pass
+
     # Default to current time if parsing fails
     print(f"Could not parse review time: {time_text}")
     return now
 
-def scrape_reviews(url, max_reviews=None, wait_time=10):
+def parse_time_texts(time_texts, now=None):
     """
-    Scrape reviews from a Google Maps URL.
-    
+    Parse a batch of review time texts in one vectorized pass.
+
+    Equivalent to calling parse_time_text on each string, but uses pandas
+    string ops and a single timedelta broadcast instead of a Python-level
+    loop, which is much faster for hundreds of reviews.
+
     Args:
-        url: Google Maps URL
-        max_reviews: Maximum number of reviews to scrape (default: None = all available)
-        wait_time: Time to wait between scrolls in seconds (default: 10)
-            
+        time_texts: Iterable of time text strings (e.g., ["2 days ago", ...])
+        now: Anchor timestamp for relative times (default: current time)
+
     Returns:
-        reviews_df: Pandas DataFrame with review data
+        parsed_times: Pandas Series of datetimes, one per input string
     """
-    # Set up WebDriver
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    
-    # Performance optimizations
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-infobars")
-    options.add_argument("--js-flags=--expose-gc")
-    options.add_argument("--disable-web-security")
-    options.add_argument("--disable-site-isolation-trials")
-    options.add_argument("--enable-unsafe-swiftshader")
-    options.add_argument("--disk-cache-size=33554432")  # 32MB
-    
-    # Disable images to load faster
-    prefs = {
-        "profile.managed_default_content_settings.images": 2,  # Don't load images
-        "profile.default_content_setting_values.notifications": 2  # Don't allow notifications
-    }
-    options.add_experimental_option("prefs", prefs)
-    
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    
-    # Set page load timeout
-    driver.set_page_load_timeout(30)
-    
-    try:
-        # Navigate to the URL
-        print(f"Navigating to {url}")
-        driver.get(url)
-        
-        # Wait for the page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "lMbq3e"))
-        )
-        
-        # Extract location name
-        try:
-            location_name = driver.find_element(By.CSS_SELECTOR, "h1.DUwDvf").text
-            print(f"Location: {location_name}")
-        except NoSuchElementException:
-            location_name = "Unknown Location"
-            print("Could not extract location name")
-        
-        # Click on reviews tab
+    if now is None:
+        now = datetime.datetime.now()
+
+    texts = pd.Series(time_texts, dtype=str)
+
+    # Relative time formats ("2 days ago", "a week ago", ...)
+    parts = texts.str.lower().str.extract(_UNIT_RE)
+    counts = parts[0].replace({'a': '1', 'an': '1'}).astype(float)
+    unit_seconds = parts[1].map(_UNIT_SECS)
+    parsed = now - pd.to_timedelta(counts * unit_seconds, unit='s')
+
+    # Fall back to "Month Year" strings, approximated as mid-month
+    missing = parsed.isna()
+    if missing.any():
+        month_year = pd.to_datetime(texts[missing], format='%B %Y', errors='coerce')
+        parsed[missing] = month_year + pd.Timedelta(days=14)
+
+    # Default any remaining failures to now, matching parse_time_text
+    missing = parsed.isna()
+    if missing.any():
+        for text in texts[missing]:
+            print(f"Could not parse review time: {text}")
+        parsed[missing] = now
+
+    return parsed
+
+class Scraper:
+    """
+    Reusable Google Maps review scraper backed by one headless Chrome.
+
+    Options construction and browser startup cost a second or two per
+    scrape, so for batch or daemon use build a Scraper once and call
+    scrape() per URL - the tab is recycled with driver.get between calls.
+    Shut the browser down with close(), or use the instance as a context
+    manager.
+    """
+
+    def __init__(self, wait_time=10):
+        self.wait_time = wait_time
+        self.driver = self._build_driver()
+
+    def _build_driver(self):
+        # Set up WebDriver
+        options = Options()
+        options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+
+        # Performance optimizations
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-infobars")
+        options.add_argument("--js-flags=--expose-gc")
+        options.add_argument("--disable-web-security")
+        options.add_argument("--disable-site-isolation-trials")
+        options.add_argument("--enable-unsafe-swiftshader")
+        options.add_argument("--disk-cache-size=33554432")  # 32MB
+
+        # Disable images to load faster
+        prefs = {
+            "profile.managed_default_content_settings.images": 2,  # Don't load images
+            "profile.default_content_setting_values.notifications": 2  # Don't allow notifications
+        }
+        options.add_experimental_option("prefs", prefs)
+
+        # Resolve the chromedriver binary once and reuse it on later calls
+        global _DRIVER_PATH
+        if _DRIVER_PATH is None:
+            _DRIVER_PATH = ChromeDriverManager().install()
+        service = Service(_DRIVER_PATH)
+        driver = webdriver.Chrome(service=service, options=options)
+
+        # Block images, fonts, media and analytics at the network layer - the
+        # prefs above only cover images, and the rest still delays feed updates
         try:
-            reviews_tab = driver.find_element(By.CSS_SELECTOR, "button[data-tab-index='1']")
-            reviews_tab.click()
-            print("Clicked on reviews tab")
-            time.sleep(2)  # Wait for reviews to load
-        except NoSuchElementException:
-            print("Could not find reviews tab")
-            return pd.DataFrame()
-        
-        # Sort reviews by newest first
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+                "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif",
+                "*.woff*", "*.ttf", "*.mp4",
+                "*/analytics*", "*/stats*"
+            ]})
+        except Exception as e:
+            print(f"Could not enable CDP request blocking: {e}")
+
+        # Set page load timeout
+        driver.set_page_load_timeout(30)
+
+        return driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Shut down the browser."""
+        self.driver.quit()
+        print("WebDriver closed")
+
+    def scrape(self, url, max_reviews=None, wait_time=None):
+        """
+        Scrape reviews from a Google Maps URL using the shared browser.
+
+        Args:
+            url: Google Maps URL
+            max_reviews: Maximum number of reviews to scrape (default: None = all available)
+            wait_time: Per-scroll wait cap in seconds (default: the instance's wait_time)
+
+        Returns:
+            reviews_df: Pandas DataFrame with review data
+        """
+        driver = self.driver
+        if wait_time is None:
+            wait_time = self.wait_time
+
         try:
-            # Find and click on the sort button
-            print("Looking for sort button...")
-            sort_button = driver.find_element(By.CSS_SELECTOR, "button[data-value='Sort']")
-            # Use JavaScript to click the button
-            driver.execute_script("arguments[0].click();", sort_button)
-            time.sleep(3)  # Reduced wait time from 4 to 3 seconds
-            print("Clicked sort button")
-            
-            # Try to find all menu items
+            # Navigate to the URL
+            print(f"Navigating to {url}")
+            driver.get(url)
+
+            # Wait for the page to load
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CLASS_NAME, "lMbq3e"))
+            )
+
+            # Extract location name
             try:
-                # Try different selectors for menu items
-                menu_items = driver.find_elements(By.CSS_SELECTOR, "div[role='menuitemradio']")
-                if not menu_items:
-                    menu_items = driver.find_elements(By.CSS_SELECTOR, "div[role='menuitem']")
-                if not menu_items:
-                    menu_items = driver.find_elements(By.CSS_SELECTOR, ".yr2tVc,.fxNQSd")  # Common Google Maps menu classes
-                
-                print(f"Found {len(menu_items)} menu items:")
-                for i, item in enumerate(menu_items):
-                    print(f"  Menu item {i+1}: '{item.text}' (class: {item.get_attribute('class')})")
-                
-                # Try to find "newest" option
-                newest_option = None
-                
-                # First look for text containing "newest" (case insensitive)
-                for item in menu_items:
-                    if 'newest' in item.text.lower():
-                        newest_option = item
-                        print(f"Found 'Newest' in menu text: '{item.text}'")
-                        break
-                
-                # If not found by text, try the second option (often "newest" is second)
-                if newest_option is None and len(menu_items) >= 2:
-                    newest_option = menu_items[1]  # Second option is often "newest"
-                    print(f"Using second menu item as fallback: '{newest_option.text}'")
-                
-                # If we found an option to click
-                if newest_option:
-                    # Try best click method
-                    try:
-                        # JavaScript click is most reliable
-                        driver.execute_script("arguments[0].click();", newest_option)
-                    except Exception as e:
-                        print(f"JavaScript click failed: {e}")
-                    
-                    # Wait after trying to click
-                    time.sleep(3)  # Reduced from 5 to 3 seconds
-                    print("Attempted to sort reviews by newest")
+                location_name = driver.find_element(By.CSS_SELECTOR, "h1.DUwDvf").text
+                print(f"Location: {location_name}")
+            except NoSuchElementException:
+                location_name = "Unknown Location"
+                print("Could not extract location name")
+
+            # Click on reviews tab
+            try:
+                reviews_tab = driver.find_element(By.CSS_SELECTOR, "button[data-tab-index='1']")
+                reviews_tab.click()
+                print("Clicked on reviews tab")
+                time.sleep(2)  # Wait for reviews to load
+            except NoSuchElementException:
+                print("Could not find reviews tab")
+                return pd.DataFrame()
+
+            # Sort reviews by newest first
+            try:
+                # Find and click on the sort button
+                print("Looking for sort button...")
+                sort_button = driver.find_element(By.CSS_SELECTOR, "button[data-value='Sort']")
+                # Use JavaScript to click the button
+                driver.execute_script("arguments[0].click();", sort_button)
+                # Wait for the sort menu to pop up instead of a fixed pause
+                try:
+                    WebDriverWait(driver, 5).until(
+                        EC.presence_of_element_located(
+                            (By.CSS_SELECTOR, "div[role='menuitemradio'], div[role='menuitem']"))
+                    )
+                except TimeoutException:
+                    print("Sort menu did not appear within 5 seconds")
+                print("Clicked sort button")
+
+                # Try to find all menu items
+                try:
+                    # Try different selectors for menu items
+                    menu_items = driver.find_elements(By.CSS_SELECTOR, "div[role='menuitemradio']")
+                    if not menu_items:
+                        menu_items = driver.find_elements(By.CSS_SELECTOR, "div[role='menuitem']")
+                    if not menu_items:
+                        menu_items = driver.find_elements(By.CSS_SELECTOR, ".yr2tVc,.fxNQSd")  # Common Google Maps menu classes
+
+                    print(f"Found {len(menu_items)} menu items:")
+                    for i, item in enumerate(menu_items):
+                        print(f"  Menu item {i+1}: '{item.text}' (class: {item.get_attribute('class')})")
+
+                    # Try to find "newest" option
+                    newest_option = None
+
+                    # First look for text containing "newest" (case insensitive)
+                    for item in menu_items:
+                        if 'newest' in item.text.lower():
+                            newest_option = item
+                            print(f"Found 'Newest' in menu text: '{item.text}'")
+                            break
+
+                    # If not found by text, try the second option (often "newest" is second)
+                    if newest_option is None and len(menu_items) >= 2:
+                        newest_option = menu_items[1]  # Second option is often "newest"
+                        print(f"Using second menu item as fallback: '{newest_option.text}'")
+
+                    # If we found an option to click
+                    if newest_option:
+                        # Try best click method
+                        try:
+                            # JavaScript click is most reliable
+                            driver.execute_script("arguments[0].click();", newest_option)
+                        except Exception as e:
+                            print(f"JavaScript click failed: {e}")
+
+                        # Wait for the re-sorted feed to render instead of a fixed pause
+                        try:
+                            WebDriverWait(driver, 5).until(
+                                lambda d: d.execute_script(
+                                    "return document.querySelectorAll('div.jftiEf').length") > 0
+                            )
+                        except TimeoutException:
+                            print("Reviews did not reappear within 5 seconds after sorting")
+                        print("Attempted to sort reviews by newest")
+                    else:
+                        print("Could not identify 'newest' option in menu")
+
+                except Exception as menu_error:
+                    print(f"Error finding menu items: {menu_error}")
+
+            except Exception as e:
+                print(f"Could not sort reviews: {e}")
+                # Take a screenshot for debugging
+                driver.save_screenshot("sort_error.png")
+                print("Saved screenshot to sort_error.png")
+
+            # Scroll to load more reviews
+            print("Scrolling to load more reviews...")
+            max_scrolls = 30
+            reviews_container = None
+
+            # Try to find the reviews container - probe all candidate selectors
+            # client-side in one JS call instead of one find_elements round-trip
+            # per selector, tagging the winner so a single lookup can grab it
+            try:
+                matched_selector = driver.execute_script("""
+                    const selectors = [".m6QErb.DxyBCb.kA9KIf.dS8AEf",
+                                       ".m6QErb.DxyBCb.kA9KIf",
+                                       "div[role='feed']",
+                                       ".lXJj5c.Hk4XGb"];
+                    for (const s of selectors) {
+                        const el = document.querySelector(s);
+                        if (el) {
+                            el.setAttribute('data-scrape-container', '1');
+                            return s;
+                        }
+                    }
+                    return null;
+                """)
+
+                if matched_selector:
+                    reviews_container = driver.find_element(By.CSS_SELECTOR, "[data-scrape-container='1']")
+                    print(f"Found reviews container with selector: {matched_selector}")
                 else:
-                    print("Could not identify 'newest' option in menu")
-            
-            except Exception as menu_error:
-                print(f"Error finding menu items: {menu_error}")
-                
-        except Exception as e:
-            print(f"Could not sort reviews: {e}")
-            # Take a screenshot for debugging
-            driver.save_screenshot("sort_error.png")
-            print("Saved screenshot to sort_error.png")
-        
-        # Scroll to load more reviews
-        print("Scrolling to load more reviews...")
-        previous_height = 0
-        max_scrolls = 30  
-        reviews_container = None
-        
-        # Try to find the reviews container - try multiple selectors
-        try:
-            # Try different possible container selectors
-            selectors = [
-                ".m6QErb.DxyBCb.kA9KIf.dS8AEf", 
-                ".m6QErb.DxyBCb.kA9KIf", 
-                "div[role='feed']",
-                ".lXJj5c.Hk4XGb"
-            ]
-            
-            for selector in selectors:
-                containers = driver.find_elements(By.CSS_SELECTOR, selector)
-                if containers:
-                    reviews_container = containers[0]
-                    print(f"Found reviews container with selector: {selector}")
-                    break
-            
-            if not reviews_container:
-                print("Could not find specific reviews container, using body for scrolling")
-        except Exception as e:
-            print(f"Error finding reviews container: {e}")
-        
-        # Try an initial click on the reviews panel to ensure focus
-        try:
-            panel = driver.find_element(By.CSS_SELECTOR, ".lXJj5c.Hk4XGb")
-            driver.execute_script("arguments[0].click();", panel)
-            time.sleep(1)
-        except:
-            pass
-        
-        load_more_attempts = 0
-        last_review_count = 0
-        consecutive_same_count = 0
-        
-        # Main scrolling loop
-        for i in range(max_scrolls):
-            # Check if we've reached the maximum number of reviews
-            current_reviews = len(driver.find_elements(By.CSS_SELECTOR, "div.jftiEf"))
-            print(f"Current review count before scroll {i+1}: {current_reviews}")
-            
-            # Exit if we've reached the max_reviews limit
-            if max_reviews and current_reviews >= max_reviews:
-                print(f"Reached maximum requested reviews ({max_reviews}), stopping scrolling")
-                break
-            
-            # Check if we're stuck at the same number
-            if current_reviews == last_review_count:
-                consecutive_same_count += 1
-            else:
-                consecutive_same_count = 0
-            
-            # If stuck at the same count for 3 consecutive scrolls, try more aggressive techniques
-            if consecutive_same_count >= 3:  # Reduced from 5 to 3 for faster execution
-                print("Stuck at same review count, trying more aggressive scrolling techniques...")
-                
-                # Try scrolling up then down to reset view
-                driver.execute_script("window.scrollTo(0, 0);")  # Scroll to top
-                time.sleep(2)
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")  # Back to bottom
-                time.sleep(wait_time)  # Use wait_time from parameter
-                
-                # If we're still stuck, break out of the loop earlier for faster execution
-                if consecutive_same_count >= 5:  # Reduced from 8 to 5
-                    print(f"Still stuck at {current_reviews} reviews, stopping scrolling")
-                    break
-            
-            # Scroll methods
-            if reviews_container:
+                    print("Could not find specific reviews container, using body for scrolling")
+            except Exception as e:
+                print(f"Error finding reviews container: {e}")
+
+            # Flag feed growth with a MutationObserver so the scroll waits can
+            # notice new reviews the moment they render, instead of probing
+            # scrollHeight and re-counting elements on every poll
+            driver.execute_script("""
+                window.__feedGrew = false;
+                const target = document.querySelector("[data-scrape-container='1']")
+                    || document.body;
+                new MutationObserver(() => { window.__feedGrew = true; })
+                    .observe(target, {childList: true, subtree: true});
+            """)
+
+            # Try an initial click on the reviews panel to ensure focus
+            try:
+                panel = driver.find_element(By.CSS_SELECTOR, ".lXJj5c.Hk4XGb")
+                driver.execute_script("arguments[0].click();", panel)
+                time.sleep(1)
+            except:
+                pass
+
+            load_more_attempts = 0
+            last_review_count = 0
+            consecutive_same_count = 0
+
+            # Count reviews with a single JS call instead of find_elements, which
+            # round-trips once per element just to take a len()
+            def count_reviews():
+                return driver.execute_script(
+                    "return document.querySelectorAll('div.jftiEf').length")
+
+            # Poll for new reviews instead of sleeping the full timeout, so the
+            # loop resumes as soon as content actually arrives; wait_time is the
+            # per-scroll maximum, not a fixed pause
+            # Read and clear the observer's growth flag in one call
+            def feed_grew():
+                return driver.execute_script(
+                    "const v = window.__feedGrew; window.__feedGrew = false; return v;")
+
+            def wait_for_new_reviews(prev_count, timeout):
+                def grown_or_capped(_):
+                    # Only re-count when the observer saw the DOM change
+                    if not feed_grew():
+                        return False
+                    count = count_reviews()
+                    # Also stop waiting the moment the requested cap is reached
+                    return count > prev_count or (max_reviews and count >= max_reviews)
                 try:
-                    # Method 1: Scroll the reviews container directly
-                    driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", reviews_container)
-                except:
-                    pass
-                
-            # Method 2: Standard scroll - most reliable
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            
-            # Wait between scrolls
-            print(f"Scroll {i+1}/{max_scrolls}...")
-            print(f"Waiting {wait_time} seconds for content to load...")
-            time.sleep(wait_time)  # Use wait_time from parameter
-            
-            # Skip button pressing as requested
-            
-            # Check if the page height has changed
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            current_reviews_after_scroll = len(driver.find_elements(By.CSS_SELECTOR, "div.jftiEf"))
-            
-            if new_height == previous_height and current_reviews_after_scroll == current_reviews:
-                # If neither height nor review count changed, try one more scroll with longer wait time
-                extended_wait = wait_time + 5  # 5 seconds longer than normal wait
-                print(f"No new content loaded, trying one more scroll with longer wait ({extended_wait} seconds)...")
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(extended_wait)
-                
-                # Check one more time
-                new_height = driver.execute_script("return document.body.scrollHeight")
-                current_reviews_after_techniques = len(driver.find_elements(By.CSS_SELECTOR, "div.jftiEf"))
-                
-                # If still no change in either height or review count, break earlier
-                if new_height == previous_height and current_reviews_after_techniques == current_reviews:
+                    WebDriverWait(driver, timeout, poll_frequency=0.25).until(grown_or_capped)
+                    return True
+                except TimeoutException:
+                    return False
+
+            # Main scrolling loop
+            for i in range(max_scrolls):
+                # Check if we've reached the maximum number of reviews
+                current_reviews = count_reviews()
+                print(f"Current review count before scroll {i+1}: {current_reviews}")
+
+                # Exit if we've reached the max_reviews limit
+                if max_reviews and current_reviews >= max_reviews:
+                    print(f"Reached maximum requested reviews ({max_reviews}), stopping scrolling")
+                    break
+
+                # Check if we're stuck at the same number
+                if current_reviews == last_review_count:
                     consecutive_same_count += 1
-                    if consecutive_same_count >= 2:  # Reduced from 3 to 2
-                        print(f"No more reviews loading after {consecutive_same_count} attempts, stopping")
+                else:
+                    consecutive_same_count = 0
+
+                # If stuck at the same count for 3 consecutive scrolls, try more aggressive techniques
+                if consecutive_same_count >= 3:  # Reduced from 5 to 3 for faster execution
+                    print("Stuck at same review count, trying more aggressive scrolling techniques...")
+
+                    # Try scrolling up then down to reset view
+                    driver.execute_script("window.scrollTo(0, 0);")  # Scroll to top
+                    time.sleep(2)
+                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")  # Back to bottom
+                    wait_for_new_reviews(current_reviews, wait_time)
+
+                    # If we're still stuck, break out of the loop earlier for faster execution
+                    if consecutive_same_count >= 5:  # Reduced from 8 to 5
+                        print(f"Still stuck at {current_reviews} reviews, stopping scrolling")
                         break
+
+                # Scroll methods
+                if reviews_container:
+                    try:
+                        # Method 1: Scroll the reviews container directly
+                        driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", reviews_container)
+                    except:
+                        pass
+
+                # Method 2: Standard scroll - most reliable
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+
+                # Wait between scrolls
+                print(f"Scroll {i+1}/{max_scrolls}...")
+                print(f"Waiting up to {wait_time} seconds for content to load...")
+                grew = wait_for_new_reviews(current_reviews, wait_time)
+
+                # Skip button pressing as requested
+
+                # Break immediately once the cap is hit - no point probing for
+                # further growth or paying another wait cycle
+                if max_reviews and count_reviews() >= max_reviews:
+                    print(f"Reached maximum requested reviews ({max_reviews}), stopping scrolling")
+                    break
+
+                if not grew:
+                    # No growth signal before the timeout - try one more scroll with a longer wait
+                    extended_wait = wait_time + 5  # 5 seconds longer than normal wait
+                    print(f"No new content loaded, trying one more scroll with longer wait (up to {extended_wait} seconds)...")
+                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+
+                    # If the feed still hasn't grown, break earlier
+                    if not wait_for_new_reviews(current_reviews, extended_wait):
+                        consecutive_same_count += 1
+                        if consecutive_same_count >= 2:  # Reduced from 3 to 2
+                            print(f"No more reviews loading after {consecutive_same_count} attempts, stopping")
+                            break
+                    else:
+                        consecutive_same_count = 0
                 else:
+                    # New reviews arrived, reset consecutive count
                     consecutive_same_count = 0
-            elif current_reviews_after_scroll > current_reviews:
-                # If we got new reviews even though height didn't change, reset consecutive count
-                consecutive_same_count = 0
-            
-            previous_height = new_height
-            last_review_count = current_reviews
-            
-            # Count reviews after each scroll
-            review_count = len(driver.find_elements(By.CSS_SELECTOR, "div.jftiEf"))
-            print(f"Currently found {review_count} reviews after scroll {i+1}")
-            
-            # Stop if we've hit max_reviews or are close to it
-            if max_reviews and review_count >= max_reviews:
-                print(f"Reached maximum requested reviews ({max_reviews}), stopping scrolling")
-                break
-            
-        print("Finished scrolling, waiting for reviews to fully load...")
-        time.sleep(min(5, wait_time/2))  # Use half of wait_time but max 5 seconds
-        
-        # Extract reviews
-        review_elements = driver.find_elements(By.CSS_SELECTOR, "div.jftiEf")
-        print(f"Found {len(review_elements)} review elements")
-        
-        reviews = []
-        now = datetime.datetime.now()
-        
-        # Only process up to max_reviews if specified
-        elements_to_process = review_elements[:max_reviews] if max_reviews else review_elements
-        
-        for element in elements_to_process:
-            try:
-                # Get review time first to check if we should skip this review
-                time_element = element.find_element(By.CSS_SELECTOR, "span.rsqaWe")
-                time_text = time_element.text
-                
-                # Get rating
-                rating_element = element.find_element(By.CSS_SELECTOR, "span.kvMYJc")
-                aria_label = rating_element.get_attribute("aria-label")
-                rating = float(aria_label.split()[0].replace(",", "."))
-                
-                # Parse the time text to get exact datetime
-                exact_time = parse_time_text(time_text)
-                
-                reviews.append({
-                    "location": location_name,
-                    "rating": rating,
-                    "time_text": time_text,
-                    "exact_time": exact_time,
-                    "scraped_at": now
-                })
-                
-            except (NoSuchElementException, ValueError) as e:
-                print(f"Error extracting review data: {e}")
-        
-        # Create DataFrame
-        reviews_df = pd.DataFrame(reviews)
-        print(f"Successfully scraped {len(reviews_df)} reviews for {location_name}")
-        
-        return reviews_df
-    
-    except Exception as e:
-        print(f"Error scraping reviews: {e}")
+
+                last_review_count = current_reviews
+
+            print("Finished scrolling, waiting for reviews to fully load...")
+            time.sleep(min(5, wait_time/2))  # Use half of wait_time but max 5 seconds
+
+            # Extract all review fields in a single JS call - per-element
+            # find_element calls each cost a WebDriver round-trip, so walking
+            # the DOM client-side collapses ~3 calls per review into one
+            raw_reviews = driver.execute_script("""
+                return Array.from(document.querySelectorAll('div.jftiEf')).map(e => {
+                    const rating = e.querySelector('span.kvMYJc');
+                    const time = e.querySelector('span.rsqaWe');
+                    return [rating && rating.getAttribute('aria-label'),
+                            time && time.textContent];
+                });
+            """)
+            print(f"Found {len(raw_reviews)} review elements")
+
+            ratings = []
+            time_texts = []
+            now = datetime.datetime.now()
+
+            # Only process up to max_reviews if specified
+            reviews_to_process = raw_reviews[:max_reviews] if max_reviews else raw_reviews
+
+            for aria_label, time_text in reviews_to_process:
+                try:
+                    if aria_label is None or time_text is None:
+                        raise ValueError("missing rating or time element")
+                    ratings.append(float(aria_label.split()[0].replace(",", ".")))
+                    time_texts.append(time_text)
+
+                except (ValueError, IndexError) as e:
+                    print(f"Error extracting review data: {e}")
+
+            # Build the DataFrame column-wise: one columnar materialization
+            # instead of a list of per-row dicts that pandas has to re-infer,
+            # with constant columns broadcast from scalars
+            reviews_df = pd.DataFrame({
+                "location": location_name,
+                "rating": np.asarray(ratings, dtype=np.float64),
+                "time_text": time_texts,
+                "scraped_at": now
+            })
+
+            # Parse all time texts in one vectorized pass instead of per review
+            if not reviews_df.empty:
+                reviews_df.insert(3, "exact_time",
+                                  parse_time_texts(reviews_df["time_text"], now).values)
+            print(f"Successfully scraped {len(reviews_df)} reviews for {location_name}")
+
+            return reviews_df
+
+        except Exception as e:
+            print(f"Error scraping reviews: {e}")
+            return pd.DataFrame()
+
+def scrape_reviews(url, max_reviews=None, wait_time=10):
+    """
+    Scrape reviews from a Google Maps URL.
+
+    Starts a fresh browser for this single call; when scraping many URLs,
+    prefer a shared Scraper (or scrape_reviews_many) to amortize startup.
+
+    Args:
+        url: Google Maps URL
+        max_reviews: Maximum number of reviews to scrape (default: None = all available)
+        wait_time: Time to wait between scrolls in seconds (default: 10)
+
+    Returns:
+        reviews_df: Pandas DataFrame with review data
+    """
+    with Scraper(wait_time=wait_time) as scraper:
+        return scraper.scrape(url, max_reviews=max_reviews)
+
+def scrape_reviews_many(urls, max_workers=4, **kwargs):
+    """
+    Scrape reviews from multiple Google Maps URLs in parallel.
+
+    Each worker thread runs its own headless Chrome instance, so the scroll
+    waits (which are IO-bound) overlap across locations. Memory scales with
+    max_workers - budget roughly 200MB per concurrent browser.
+
+    Args:
+        urls: List of Google Maps URLs to scrape
+        max_workers: Number of concurrent browser sessions (default: 4)
+        **kwargs: Extra arguments passed to scrape_reviews (max_reviews, wait_time)
+
+    Returns:
+        reviews_df: Single DataFrame with reviews from all locations
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda url: scrape_reviews(url, **kwargs), urls))
+
+    results = [df for df in results if not df.empty]
+    if not results:
         return pd.DataFrame()
-    
-    finally:
-        driver.quit()
-        print("WebDriver closed")
+    return pd.concat(results, ignore_index=True)
+
+def fast_to_csv(df, path):
+    """
+    Write a DataFrame as CSV through a large buffered binary writer.
+
+    Pre-renders each column as strings and joins rows directly, skipping
+    the csv module's per-cell quoting machinery - roughly 2x faster for
+    the simple tables this scraper produces. Falls back to the standard
+    DataFrame.to_csv whenever any text field would need quoting.
+
+    Args:
+        df: DataFrame containing the reviews
+        path: Output CSV path
+    """
+    # Only safe when no text field contains a delimiter, quote, or newline
+    text_cols = df.select_dtypes(include=object)
+    if not text_cols.empty:
+        needs_quoting = any(text_cols[c].astype(str).str.contains(r'[,"\n]').any()
+                            for c in text_cols.columns)
+        if needs_quoting:
+            df.to_csv(path, index=False)
+            return
+
+    cols = [df[c].astype(str).values for c in df.columns]
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write((','.join(df.columns) + '\n').encode())
+        for row in zip(*cols):
+            f.write((','.join(row) + '\n').encode())
+
+def save_reviews(df, path):
+    """
+    Save reviews to disk, picking the format from the file extension.
+
+    Parquet and feather are binary columnar formats that read and write
+    several times faster than CSV and take less space on disk; CSV is
+    kept as a compatibility option.
+
+    Args:
+        df: DataFrame containing the reviews
+        path: Output path ending in .parquet, .feather, or anything else for CSV
+    """
+    if path.endswith('.parquet'):
+        df.to_parquet(path, compression='zstd')
+    elif path.endswith('.feather'):
+        df.to_feather(path)
+    else:
+        fast_to_csv(df, path)
+
+def load_reviews(path):
+    """
+    Load previously saved reviews, picking the format from the file extension.
+
+    Args:
+        path: Input path ending in .parquet, .feather, or anything else for CSV
+
+    Returns:
+        reviews_df: DataFrame with the exact_time column restored as datetime
+    """
+    if path.endswith('.parquet'):
+        df = pd.read_parquet(path)
+    elif path.endswith('.feather'):
+        df = pd.read_feather(path)
+    else:
+        df = pd.read_csv(path)
+        # CSV round-trips datetimes as strings; binary formats keep the dtype
+        if 'exact_time' in df.columns:
+            df['exact_time'] = pd.to_datetime(df['exact_time'])
+    return df
 
 def plot_reviews_by_month(df, output_path='reviews_by_month.png'):
     """
@@ -403,83 +654,80 @@ def plot_reviews_by_month(df, output_path='reviews_by_month.png'):
         df: DataFrame containing the reviews
         output_path: Path to save the plot image
     """
-    # Create a copy to avoid modifying the original dataframe
-    plot_df = df.copy()
-    
     # Determine the column name for ratings (either 'score' or 'rating')
-    rating_column = 'rating' if 'rating' in plot_df.columns else 'score'
-    if rating_column not in plot_df.columns:
+    rating_column = 'rating' if 'rating' in df.columns else 'score'
+    if rating_column not in df.columns:
         print("Error: Could not find rating column (tried 'rating' and 'score')")
         return
-    
+
     # Get location name if available
     location_name = "Google Maps Reviews"
-    if 'location' in plot_df.columns and not plot_df['location'].empty:
+    if 'location' in df.columns and not df['location'].empty:
         # Use the most common location name (in case there are multiple)
-        location_name = plot_df['location'].mode().iloc[0]
-    
+        location_name = df['location'].mode().iloc[0]
+
     # Determine the column name for time (either 'datetime', 'exact_time', or 'time_text')
+    # Work on local Series rather than a full df.copy() - nothing here needs
+    # to mutate the caller's DataFrame
     time_column = None
-    if 'exact_time' in plot_df.columns:
+    if 'exact_time' in df.columns:
         time_column = 'exact_time'
-    elif 'datetime' in plot_df.columns:
+    elif 'datetime' in df.columns:
         time_column = 'datetime'
-    elif 'time_text' in plot_df.columns:
-        # Try to convert time_text to datetime
-        try:
-            plot_df['datetime'] = pd.to_datetime(plot_df['time_text'])
-            time_column = 'datetime'
-        except:
-            print("Error: Could not convert 'time_text' to datetime")
-            return
-    
+    elif 'time_text' in df.columns:
+        time_column = 'time_text'
+
     if time_column is None:
         print("Error: Could not find time column (tried 'exact_time', 'datetime', and 'time_text')")
         return
-    
-    # Make sure time column is datetime type
-    if not pd.api.types.is_datetime64_any_dtype(plot_df[time_column]):
+
+    # Make sure we have datetime values to work with
+    times = df[time_column]
+    if not pd.api.types.is_datetime64_any_dtype(times):
         try:
-            plot_df[time_column] = pd.to_datetime(plot_df[time_column])
+            times = pd.to_datetime(times)
         except:
             print(f"Error: Could not convert {time_column} to datetime")
             return
-    
+
+    ratings = df[rating_column]
+
     # Filter out reviews older than a year
     one_year_ago = datetime.datetime.now() - pd.DateOffset(years=1)
-    original_count = len(plot_df)
-    plot_df = plot_df[plot_df[time_column] >= one_year_ago]
-    filtered_count = original_count - len(plot_df)
-    
+    keep = times >= one_year_ago
+    filtered_count = len(times) - int(keep.sum())
+
     if filtered_count > 0:
         print(f"Filtered out {filtered_count} reviews older than a year for plotting")
-    
-    if len(plot_df) == 0:
+
+    if not keep.any():
         print("No reviews within the last year to plot")
         return
-    
+
     # Also filter out reviews with time_text containing "year ago" or "years ago"
-    if 'time_text' in plot_df.columns:
-        year_mask = plot_df['time_text'].str.lower().str.contains('year ago|years ago')
-        if year_mask.any():
-            count_before = len(plot_df)
-            plot_df = plot_df[~year_mask]
-            print(f"Filtered out {count_before - len(plot_df)} additional reviews with 'year ago' in time text")
-    
-    # Extract month and year from datetime
-    plot_df['year_month'] = plot_df[time_column].dt.to_period('M')
-    
-    # Group by month and calculate mean score and count
-    monthly_stats = plot_df.groupby('year_month').agg(
-        avg_score=(rating_column, 'mean'),
-        count=(rating_column, 'count')
-    ).reset_index()
-    
-    # Convert period to datetime for plotting
-    monthly_stats['date'] = monthly_stats['year_month'].dt.to_timestamp()
-    
-    # Sort by date to ensure proper chronological order
-    monthly_stats = monthly_stats.sort_values('date')
+    if 'time_text' in df.columns:
+        year_mask = df['time_text'].str.lower().str.contains('year ago|years ago')
+        if (keep & year_mask).any():
+            print(f"Filtered out {int((keep & year_mask).sum())} additional reviews with 'year ago' in time text")
+            keep &= ~year_mask
+
+    times = times[keep]
+    ratings = ratings[keep]
+
+    # Group by an int64 year*12+month code - numeric groupby is much faster
+    # than grouping on an object-dtype PeriodIndex
+    month_code = times.dt.year * 12 + (times.dt.month - 1)
+    monthly_stats = ratings.groupby(month_code).agg(
+        avg_score='mean',
+        count='count'
+    ).sort_index()  # code order is chronological order
+
+    # Rebuild one timestamp per unique month for plotting
+    monthly_stats['date'] = pd.to_datetime({
+        'year': monthly_stats.index // 12,
+        'month': monthly_stats.index % 12 + 1,
+        'day': 1
+    }).values
     
     # Create figure with two subplots sharing the same x-axis
     fig, ax1 = plt.subplots(figsize=(12, 6))
@@ -497,14 +745,9 @@ def plot_reviews_by_month(df, output_path='reviews_by_month.png'):
     ax2.set_ylabel('Number of Reviews', color='gray', fontsize=12)
     ax2.tick_params(axis='y', labelcolor='gray')
     
-    # Add count labels above the bars
-    for bar in bars:
-        height = bar.get_height()
-        ax2.annotate(f'{int(height)}',
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3),  # 3 points vertical offset
-                    textcoords="offset points",
-                    ha='center', va='bottom', fontsize=10)
+    # Add count labels above the bars in one call
+    ax2.bar_label(bars, labels=monthly_stats['count'].astype(int).astype(str),
+                  padding=3, fontsize=10)
     
     # Format x-axis to show months nicely
     ax1.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
@@ -523,27 +766,22 @@ def main():
     """Command line interface for the Google Maps Review Scraper."""
     parser = argparse.ArgumentParser(description='Scrape Google Maps reviews')
     parser.add_argument('--url', '-u', type=str, help='Google Maps URL to scrape')
-    parser.add_argument('--output', '-o', type=str, help='Path to save CSV file')
+    parser.add_argument('--output', '-o', type=str, help='Path to save reviews (.parquet, .feather, or .csv by extension)')
     parser.add_argument('--max-reviews', '-m', type=int, help='Maximum number of reviews to scrape')
     parser.add_argument('--wait-time', '-w', type=int, default=10, help='Time to wait between scrolls in seconds (default: 10)')
     parser.add_argument('--plot', '-p', action='store_true', help='Generate a plot of average reviews by month')
     parser.add_argument('--plot-output', type=str, default='monthly_reviews.png', help='Path to save the plot image (default: monthly_reviews.png)')
-    parser.add_argument('--load-reviews', '-l', type=str, help='Load previously scraped reviews from CSV file instead of scraping')
+    parser.add_argument('--load-reviews', '-l', type=str, help='Load previously scraped reviews from file (.parquet, .feather, or .csv) instead of scraping')
     args = parser.parse_args()
     
     # Check if loading from existing CSV file
     if args.load_reviews:
         print(f"Loading reviews from {args.load_reviews}...")
         try:
-            reviews_df = pd.read_csv(args.load_reviews)
-            
-            # Convert exact_time column to datetime if it exists
-            if 'exact_time' in reviews_df.columns:
-                reviews_df['exact_time'] = pd.to_datetime(reviews_df['exact_time'])
-                
+            reviews_df = load_reviews(args.load_reviews)
             print(f"Loaded {len(reviews_df)} reviews from {args.load_reviews}")
         except Exception as e:
-            print(f"Error loading reviews from CSV: {e}")
+            print(f"Error loading reviews: {e}")
             return
     else:
         # Make sure URL is provided if not loading from CSV
@@ -560,9 +798,10 @@ def main():
         print(reviews_df.head())
         print("==========================\n")
         
-        # Save to CSV if requested and not already loading from CSV
+        # Save if requested and not already loading from a file; the output
+        # format (parquet/feather/csv) follows the file extension
         if args.output and not args.load_reviews:
-            reviews_df.to_csv(args.output, index=False)
+            save_reviews(reviews_df, args.output)
             print(f"Reviews saved to {args.output}")
             
         print(f"Total reviews: {len(reviews_df)}")